@@ -1,9 +1,11 @@
 import json, platform, sys, os, subprocess, pkgutil
 from code_genie_cli.definitions import DEBUG
 from colorama import Fore
+from code_genie_cli.terminal_renderer import TerminalRenderer
 
 class ChatHistory:
-  def __init__(self):
+  def __init__(self, renderer: TerminalRenderer):
+    self.renderer = renderer
     # items in this list look like {"role": "user", "content": prompt, "tokens": usage.prompt_tokens}
     # role can be "user", "system", or "assistant"
     # content is just text
@@ -16,14 +18,13 @@ class ChatHistory:
 
   def add_item(self, item: dict):
     if DEBUG:
-      print(Fore.YELLOW + f"Debug, adding item to chat history:\n {json.dumps(item, indent=2)}")
+      self.renderer.write(Fore.YELLOW + f"Debug, adding item to chat history:\n {json.dumps(item, indent=2)}{Fore.RESET}\n")
     self.history.append(item)
 
   def get_history(self):
     if DEBUG:
-      print(Fore.YELLOW + f"Debug, would you like to see the chat history? (y/n)")
-      if input().lower() == "y":
-        print(Fore.YELLOW + f"Debug, history before restraining: {self.history}")
+      if self.renderer.read_input(Fore.YELLOW + f"Debug, would you like to see the chat history? (y/n){Fore.RESET}\n").lower() == "y":
+        self.renderer.write(Fore.YELLOW + f"Debug, history before restraining: {self.history}{Fore.RESET}\n")
     self.__restrain_history()
     # We need to remove the tokens key from the history because it's not part of the messages list that we send to OpenAI
     return [{k: v for k, v in item.items() if k != "tokens"} for item in self.history]
@@ -39,7 +40,7 @@ class ChatHistory:
     if len(self.history) >= 2:
       removed_message = self.history.pop(1)
       if DEBUG:
-        print(Fore.YELLOW + f"Debug, removed message from chat history to keep it below the token limit:\n {json.dumps(removed_message, indent=2)}")
+        self.renderer.write(Fore.YELLOW + f"Debug, removed message from chat history to keep it below the token limit:\n {json.dumps(removed_message, indent=2)}{Fore.RESET}\n")
     else:
       # We would only ever hit this if the system role message was over the history token limit, so it shouldn't ever happen
       # However, if it does, we should just exit the program rather than looping infinitely in __restrain_history()
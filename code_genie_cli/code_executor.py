@@ -1,5 +1,5 @@
 import logging, os, select, subprocess, sys, tempfile, pty
-from colorama import Fore
+from colorama import Fore, Style
 # For some reason Fore.RESET is actually secretly Style.RESET_ALL and this is undocumented behoaviour.
 # So we need to manually set Fore.RESET to the correct value which will only reset the foreground colour and not touch the style.
 Fore.RESET = "\033[39m"
@@ -7,8 +7,13 @@ from code_genie_cli.definitions import DEBUG
 from typing import Dict, Optional, Any, List, Tuple
 from code_genie_cli.timeout_handler import TimeoutHandler
 from code_genie_cli.first_in_first_out_io import FirstInFirstOutIO
+from code_genie_cli.terminal_renderer import TerminalRenderer
 
 class CodeExecutor:
+  # Live output is written through the renderer, so it can't interleave with anything else drawing to the terminal
+  def __init__(self, renderer: TerminalRenderer):
+    self.renderer = renderer
+
   # If live_output is True, the output of the code will be printed to stdout as it is generated.
   # If live_output is True or False you will still always have the full output string retuned in the Tuple along with the success boolean
   # max_output_size is the maximum size of the output string. Helpful to prevent excessive memory usage, and to prevent the output from being too large to send to OpenAI
@@ -51,7 +56,7 @@ class CodeExecutor:
               break
             for line in data.splitlines():
               if live_output:
-                print(line)
+                self.__print(line)
               logger.info(line)
           if process.poll() is not None:
             break
@@ -66,7 +71,7 @@ class CodeExecutor:
       message=f"Provided code took too long to finish execution. TimeoutError: Timeout after {timeout_seconds} seconds."
       logger.error(message)
       if live_output:
-        print(message)
+        self.__print(message)
       success = False
     # Trying to only catch errors that are caused by the code execution and not errors in the code_genie_cli
     except (subprocess.CalledProcessError, RuntimeError) as e:
@@ -74,7 +79,7 @@ class CodeExecutor:
       message=f"Error executing code: {str(e)}"
       logger.error(message)
       if live_output:
-        print(message)
+        self.__print(message)
       success = False
     finally:
       # Remove the temporary file after execution
@@ -83,8 +88,11 @@ class CodeExecutor:
       log_capture_string.close()
       logger.removeHandler(handler) # Just being explicit here
       if DEBUG:
-        print(f"{Fore.YELLOW}Debug, the exit code of the code was: {os.WEXITSTATUS(exit_code)} and success is set to: {success}")
-        print(f"Would you like to see the output of the code? (y/n) {Fore.RESET}")
-        if input().lower() == 'y':
-          print(output_string)
-      return success, output_string
\ No newline at end of file
+        self.__print(f"{Fore.YELLOW}Debug, the exit code of the code was: {os.WEXITSTATUS(exit_code)} and success is set to: {success}")
+        if self.renderer.read_input(f"Would you like to see the output of the code? (y/n) {Fore.RESET}\n").lower() == 'y':
+          self.__print(output_string)
+      return success, output_string
+
+  def __print(self, text: str) -> None:
+    # The subprocess output may contain its own ANSI codes, reset after each line like print() did under colorama's autoreset
+    self.renderer.write(text + Style.RESET_ALL + "\n")
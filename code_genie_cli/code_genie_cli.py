@@ -13,7 +13,7 @@ from code_genie_cli.definitions import KEY_PATH, DEBUG
 from code_genie_cli.openai_api_caller import OpenaiApiCaller
 from code_genie_cli.code_executor import CodeExecutor
 from code_genie_cli.system_content import SystemContent
-from code_genie_cli.spinner import Spinner
+from code_genie_cli.terminal_renderer import TerminalRenderer
 
 # Create a custom key binding to allow multiline input
 bindings = KeyBindings()
@@ -39,15 +39,16 @@ def _(event):
 # This class mainly handles the user input and the response from OpenAI
 class CodeGenieCLI:
   def __init__(self) -> None:
+    # All terminal output goes through the renderer so the spinner, responses and execution output never interleave
+    self.renderer = TerminalRenderer()
     # The OpenaiApiCaller instance handles messy things like reading the API key and keeping track of the chat history
-    self.openai_api_caller = OpenaiApiCaller()
-    self.code_executor = CodeExecutor()
-    self.spinner = Spinner()
+    self.openai_api_caller = OpenaiApiCaller(self.renderer)
+    self.code_executor = CodeExecutor(self.renderer)
 
   def run(self) -> None:
       try:
         self.__clear_terminal()
-        print(f"{Style.BRIGHT}{Fore.GREEN}Welcome to {Fore.BLUE}code-genie-cli{Fore.GREEN}!{Fore.RESET}")
+        self.renderer.write(f"{Style.BRIGHT}{Fore.GREEN}Welcome to {Fore.BLUE}code-genie-cli{Fore.GREEN}!{Style.RESET_ALL}\n")
         # Our first prompt will be the system message, this gets genie to introduce themselves to the user as well as allowing us to calculate how many tokens it is
         self.__chat_ask_and_response_handling(SystemContent().generate(), "system")
         first_promt_injection = " (alt + enter for new line)"
@@ -55,12 +56,16 @@ class CodeGenieCLI:
         while True:
           # TODO: seems to be some weird behavior where the cursor doesn't move to the next character on first key press. So the 2nd character then overwrites it.
           # However this is only a visual thing and when you hit enter the characters all re-appear
+          self.renderer.flush()
           user_message = prompt(ANSI(f"\n{Style.BRIGHT}{Fore.GREEN}User{first_promt_injection}:{Fore.RESET} "), key_bindings=bindings)
           first_promt_injection = ""
           self.__chat_ask_and_response_handling(user_message)
       except KeyboardInterrupt:
-        print(f"{Fore.YELLOW}\n\nExiting the script gracefully.{Style.RESET_ALL}")
+        self.renderer.write(f"{Fore.YELLOW}\n\nExiting the script gracefully.{Style.RESET_ALL}\n")
         sys.exit(0)
+      finally:
+        # Stops the spinner and drains anything still buffered, whichever way we're leaving
+        self.renderer.close()
 
   def __clear_terminal(self):
     if os.name == 'posix':  # for Linux and macOS
@@ -69,11 +74,9 @@ class CodeGenieCLI:
         _ = subprocess.call('cls', shell=True)
 
   def __chat_ask_and_response_handling(self, user_message: Optional[str] = None, role: str = "user") -> None:
-    print(Fore.BLUE, end="")
-    self.spinner.continue_spinner()
+    self.renderer.start_spinner(Fore.BLUE)
     response = self.openai_api_caller.chat(user_message, role)
-    self.spinner.halt_spinner()
-    print(Fore.RESET, end="")
+    self.renderer.stop_spinner()
 
     # Find all code blocks within triple backticks
     code_blocks = re.findall(r"(```\S*\n)([\s\S]*?)(```)", response)
@@ -85,7 +88,7 @@ class CodeGenieCLI:
         colored_code_block = f"{opening}{colored_content}{closing}"
         colored_response = colored_response.replace(f"{opening}{content}{closing}", colored_code_block)
 
-    print(Fore.BLUE + "\nGenie:\n" + Fore.RESET + colored_response)
+    self.renderer.write(Fore.BLUE + "\nGenie:\n" + Fore.RESET + colored_response + "\n")
 
     # We ignore any words on the same line as the opening backticks, as they are likely to be a language specifier
     # So for example ```python is treated the same as ```
@@ -94,15 +97,15 @@ class CodeGenieCLI:
         # Merge all code blocks into a single block, separated by a newline character
         merged_code_blocks = "\n".join(code.strip() for code in code_blocks)
 
-        action = input(f"{Fore.CYAN}\nExecute the provided code? (y/n) {Fore.RESET}").lower()
+        action = self.renderer.read_input(f"{Fore.CYAN}\nExecute the provided code? (y/n) {Fore.RESET}").lower()
         if action == "y":
             self.__execute_code_with_chat_output(merged_code_blocks)
 
   def __execute_code_with_chat_output(self, code: str) -> None:
-    print(Fore.CYAN + f"\nExecution output: {Fore.RESET}")
+    self.renderer.write(Fore.CYAN + f"\nExecution output: {Fore.RESET}\n")
     success, output = self.code_executor.execute_code(code)
     if output.strip():
-      action = input(f"{Fore.GREEN}\nWould you like to give the {'output' if success else 'error'} back to {Fore.BLUE}Genie{Fore.GREEN}? (y/n) {Fore.RESET}").lower()
+      action = self.renderer.read_input(f"{Fore.GREEN}\nWould you like to give the {'output' if success else 'error'} back to {Fore.BLUE}Genie{Fore.GREEN}? (y/n) {Fore.RESET}").lower()
       if action == "y":
         if success:
           self.__chat_ask_and_response_handling(f"The code execution outputed: \n{output}")
@@ -114,4 +117,4 @@ class CodeGenieCLI:
             bonus = "Please fix your code and try again. Provide a single python script to solve the users request."
           self.__chat_ask_and_response_handling(f"An error occoured. {bonus} Here's the output: \n{output}")
     else:
-      print(f"No output from code execution.")
+      self.renderer.write(f"No output from code execution.\n")
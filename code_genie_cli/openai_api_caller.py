@@ -1,6 +1,7 @@
 import openai, sys, json
 from code_genie_cli.definitions import KEY_PATH, DEBUG
 from code_genie_cli.chat_history import ChatHistory
+from code_genie_cli.terminal_renderer import TerminalRenderer
 from colorama import Fore, Style
 # For some reason Fore.RESET is actually secretly Style.RESET_ALL and this is undocumented behoaviour.
 # So we need to manually set Fore.RESET to the correct value which will only reset the foreground colour and not touch the style.
@@ -8,9 +9,11 @@ Fore.RESET = "\033[39m"
 
 
 class OpenaiApiCaller:
-    def __init__(self):
+    def __init__(self, renderer: TerminalRenderer):
+      # Everything we print goes through the renderer, chat() runs while the spinner is animating
+      self.renderer = renderer
       openai.api_key = self.__read_api_key_from_file()
-      self.chat_history = ChatHistory()
+      self.chat_history = ChatHistory(renderer)
       self.temperature = 0.3 # Minimum value is 0.0, maximum value is 1.0. We want the model to be fairly consistent and not too random.
 
     def __read_api_key_from_file(self) -> str:
@@ -18,8 +21,8 @@ class OpenaiApiCaller:
         with open(KEY_PATH, 'r') as f:
           return f.read().strip()
       except FileNotFoundError:
-        print(f"{Fore.RED}Error: The API key file '{KEY_PATH}' was not found.")
-        print(f"Please make sure the file exists and contains your API key.{Style.RESET_ALL}")
+        self.renderer.write(f"{Fore.RED}Error: The API key file '{KEY_PATH}' was not found.\n")
+        self.renderer.write(f"Please make sure the file exists and contains your API key.{Style.RESET_ALL}\n")
         sys.exit(1)
 
     # Role is an option so you can choose to send a message as the user or the system
@@ -31,8 +34,8 @@ class OpenaiApiCaller:
       # Add the user's user_message to the end of the self.chat_history list
       temporary_chat_history.append({"role": role, "content": user_message})
       if DEBUG:
-        if input(f"{Fore.YELLOW}Debug, would you like to see the message that'll be sent to GPT? (y/n) {Fore.RESET}").lower() == "y":
-          print(f"temporary_chat_history: {temporary_chat_history}")
+        if self.renderer.read_input(f"{Fore.YELLOW}Debug, would you like to see the message that'll be sent to GPT? (y/n) {Fore.RESET}").lower() == "y":
+          self.renderer.write(f"temporary_chat_history: {temporary_chat_history}\n")
 
       # Attempt to query openai
       try:
@@ -65,17 +68,19 @@ class OpenaiApiCaller:
         )
       except Exception as e:
         if DEBUG:
-          print(f"{Fore.YELLOW}Debug, all messages: {json.dumps(temporary_chat_history, indent=2)}")
-        print(f"{Fore.RED}Error: Failed to send message to OpenAI.")
-        print(f"Error message: {e}{Style.RESET_ALL}")
+          self.renderer.write(f"{Fore.YELLOW}Debug, all messages: {json.dumps(temporary_chat_history, indent=2)}{Fore.RESET}\n")
+        self.renderer.write(f"{Fore.RED}Error: Failed to send message to OpenAI.\n")
+        self.renderer.write(f"Error message: {e}{Style.RESET_ALL}\n")
+        # Stop the spinner and get the error onto the screen before we exit
+        self.renderer.close()
         sys.exit(1)
       
       if DEBUG:
-        if input(f"{Fore.YELLOW}Debug, would you like to see the raw response object? (y/n) {Fore.RESET}").lower() == "y":
-          print(f"{Fore.YELLOW}Debug, response:\n{Fore.RESET}{json.dumps(response, indent=2)}")
+        if self.renderer.read_input(f"{Fore.YELLOW}Debug, would you like to see the raw response object? (y/n) {Fore.RESET}").lower() == "y":
+          self.renderer.write(f"{Fore.YELLOW}Debug, response:\n{Fore.RESET}{json.dumps(response, indent=2)}\n")
 
-        if input(f"{Fore.YELLOW}Debug, would you like to override GPT's message? (y/n) {Fore.RESET}").lower() == "y":
-          response.choices[0].message.content = input(f"{Fore.YELLOW}Okay, what would you like GPT to respond with? {Fore.RESET}")
+        if self.renderer.read_input(f"{Fore.YELLOW}Debug, would you like to override GPT's message? (y/n) {Fore.RESET}").lower() == "y":
+          response.choices[0].message.content = self.renderer.read_input(f"{Fore.YELLOW}Okay, what would you like GPT to respond with? {Fore.RESET}")
       
       # Okay, we got our response back so now we can add our user_message to the chat history.
       self.chat_history.add_item({
@@ -90,7 +95,7 @@ class OpenaiApiCaller:
       })
 
       if (response.choices[0].finish_reason == "length"):
-          print(Fore.YELLOW + "Warning: OpenAI returned a truncated response due to token limit.")
+          self.renderer.write(Fore.YELLOW + "Warning: OpenAI returned a truncated response due to token limit." + Fore.RESET + "\n")
           # There is no way to handle this error, this is a hard limit and the user can only lower their input length. 
           # God knows how they managed to hit this anyway as chat_history.py deletes old history to keep it below 2048 tokens.
       
@@ -0,0 +1,161 @@
+import atexit, threading, sys, time
+from typing import Callable, List, Optional, TextIO
+from colorama import Fore
+# For some reason Fore.RESET is actually secretly Style.RESET_ALL and this is undocumented behoaviour.
+# So we need to manually set Fore.RESET to the correct value which will only reset the foreground colour and not touch the style.
+Fore.RESET = "\033[39m"
+
+# Owns the terminal. Everything that wants to reach stdout (the spinner, the genie's responses and live execution output)
+# goes through write(), which only buffers the text. A single daemon thread then coalesces whatever has been buffered into
+# one write + flush per frame, capped at max_fps, so chunks from different sources can never interleave mid-line.
+# When there's no pending text and the spinner isn't running the thread blocks on a condition and doesn't wake up at all.
+# Note colorama's init(autoreset=True) appends a style reset after every write() to stdout, and since a whole frame is one
+# write() that now happens once per frame rather than once per print(). Anything written with a colour or style should
+# end with its own Fore.RESET/Style.RESET_ALL, otherwise it carries over into whatever is written after it.
+# Pass background=False to skip the thread and drive frames yourself with render_frame(), the tests use this with a fake clock.
+class TerminalRenderer:
+  SPINNER_GLYPHS = '|/-\\'
+
+  def __init__(self, stream: Optional[TextIO] = None, max_fps: int = 30, spinner_interval: float = 0.1,
+               clock: Callable[[], float] = time.monotonic, background: bool = True):
+    # Resolve sys.stdout here rather than as a default argument so we pick up colorama's wrapped stream
+    self.__stream = stream or sys.stdout
+    self.__frame_interval = 1.0 / max_fps
+    self.__spinner_interval = spinner_interval
+    self.__clock = clock
+    self.__condition = threading.Condition()
+    self.__pending: List[str] = []
+    self.__spinning = False
+    self.__spinner_colour = ""
+    self.__spinner_visible = False
+    self.__spinner_index = 0
+    self.__last_frame = float('-inf')
+    self.__last_spin = float('-inf')
+    self.__closed = False
+    self.__thread: Optional[threading.Thread] = None
+    if background:
+      self.__thread = threading.Thread(target=self.__render_loop)
+      self.__thread.daemon = True  # Set the thread as a daemon thread
+      self.__thread.start()
+    # write() only buffers, so make sure anything already accepted reaches the terminal however the process exits
+    atexit.register(self.close)
+
+  # Queue text for the next frame. Safe to call from any thread.
+  # Once closed there's no render thread left, so the text is drawn straight away instead.
+  def write(self, text: str) -> None:
+    if not text:
+      return
+    with self.__condition:
+      # Only wake the render thread when this is the first text since the last frame. If text is already pending the
+      # thread is either about to draw or waiting out the frame cap, and waking it per write would just send it back to sleep.
+      was_empty = not self.__pending
+      self.__pending.append(text)
+      if self.__closed:
+        self.__draw_frame()
+      elif was_empty:
+        self.__condition.notify()
+
+  # Spin baby spin. The colour is wrapped around every glyph, as colorama resets the style after each frame.
+  def start_spinner(self, colour: str = "") -> None:
+    with self.__condition:
+      if self.__closed:
+        return
+      self.__spinner_colour = colour
+      self.__spinning = True
+      self.__condition.notify()
+
+  # Stop the spinner, the glyph is removed on the next frame
+  def stop_spinner(self) -> None:
+    with self.__condition:
+      self.__spinning = False
+      self.__condition.notify()
+
+  # Stop the spinner, draw whatever is still pending and let the render thread exit.
+  # Registered with atexit, but safe to call more than once.
+  def close(self) -> None:
+    with self.__condition:
+      if self.__closed:
+        return
+      self.__spinning = False
+      self.__draw_frame()
+      self.__closed = True
+      self.__condition.notify_all()
+    if self.__thread is not None and self.__thread is not threading.current_thread():
+      self.__thread.join()
+    atexit.unregister(self.close)
+
+  # Pauses the spinner while waiting on the user, as input() writes its prompt to the terminal itself
+  def read_input(self, message: str = "") -> str:
+    with self.__condition:
+      was_spinning = self.__spinning
+      self.__spinning = False
+      self.__pending.append(message)
+      self.__draw_frame()
+    try:
+      return input()
+    finally:
+      if was_spinning:
+        self.start_spinner(self.__spinner_colour)
+
+  # Draw everything that's pending right now, ignoring the frame rate cap.
+  # Call this before handing the terminal to anything else, like input() or prompt_toolkit.
+  def flush(self) -> None:
+    with self.__condition:
+      self.__draw_frame()
+
+  # Draw a single frame if one is due, returns whether anything was drawn.
+  # This is the same step the render thread takes, for driving the renderer without it.
+  def render_frame(self) -> bool:
+    with self.__condition:
+      if self.__next_frame_delay() != 0:
+        return False
+      self.__draw_frame()
+      return True
+
+  def __has_work(self) -> bool:
+    return bool(self.__pending) or self.__spinning or self.__spinner_visible
+
+  # Seconds until the next frame is due, or None if there's nothing to draw. Must be called with the condition held.
+  def __next_frame_delay(self) -> Optional[float]:
+    if not self.__has_work():
+      return None
+    deadline = self.__last_frame + self.__frame_interval
+    if not self.__pending and self.__spinning and self.__spinner_visible:
+      # Only the spinner needs drawing, so there's no point redrawing faster than it animates
+      deadline = max(deadline, self.__last_spin + self.__spinner_interval)
+    return max(0.0, deadline - self.__clock())
+
+  def __render_loop(self) -> None:
+    with self.__condition:
+      while not self.__closed:
+        delay = self.__next_frame_delay()
+        if delay is None:
+          # Nothing to draw, sleep until someone calls write(), start_spinner() or close()
+          self.__condition.wait()
+        elif delay > 0:
+          # Releases the lock while waiting, so writes that arrive in the meantime get coalesced into this frame
+          self.__condition.wait(delay)
+        else:
+          self.__draw_frame()
+
+  # Must be called with the condition held
+  def __draw_frame(self) -> None:
+    if not self.__has_work():
+      return
+    now = self.__clock()
+    out = []
+    if self.__spinner_visible:
+      # If the spinner keeps going and nothing else is being drawn a backspace is enough, the next glyph overwrites the old one
+      out.append('\b' if self.__spinning and not self.__pending else '\b \b')
+      self.__spinner_visible = False
+    out.extend(self.__pending)
+    self.__pending.clear()
+    if self.__spinning:
+      glyph = self.SPINNER_GLYPHS[self.__spinner_index]
+      out.append(f"{self.__spinner_colour}{glyph}{Fore.RESET}" if self.__spinner_colour else glyph)
+      self.__spinner_index = (self.__spinner_index + 1) % len(self.SPINNER_GLYPHS)
+      self.__spinner_visible = True
+      self.__last_spin = now
+    self.__stream.write(''.join(out))
+    self.__stream.flush()
+    self.__last_frame = now
@@ -0,0 +1,133 @@
+import io, threading, unittest
+from unittest import mock
+from colorama import Fore
+from code_genie_cli.terminal_renderer import TerminalRenderer
+
+# Records every write() separately so we can check how the renderer batches its output
+class RecordingStream(io.StringIO):
+  def __init__(self):
+    super().__init__()
+    self.writes = []
+
+  def write(self, text):
+    self.writes.append(text)
+    return super().write(text)
+
+# A clock that only moves when the test says so
+class FakeClock:
+  def __init__(self):
+    self.now = 0.0
+
+  def __call__(self):
+    return self.now
+
+# Frames are driven by hand with render_frame(), so nothing here depends on how fast the machine is
+class TestTerminalRenderer(unittest.TestCase):
+  def setUp(self):
+    self.stream = RecordingStream()
+    self.clock = FakeClock()
+    self.renderer = TerminalRenderer(self.stream, max_fps=10, spinner_interval=0.2, clock=self.clock, background=False)
+
+  def tearDown(self):
+    self.renderer.close()
+
+  def test_writes_in_one_frame_are_coalesced(self):
+    for i in range(50):
+      self.renderer.write(f"line {i}\n")
+    self.assertTrue(self.renderer.render_frame())
+    self.assertEqual(self.stream.writes, ["".join(f"line {i}\n" for i in range(50))])
+
+  def test_frame_rate_is_capped(self):
+    self.renderer.write("first\n")
+    self.assertTrue(self.renderer.render_frame())
+    self.renderer.write("second\n")
+    self.clock.now = 0.05
+    self.assertFalse(self.renderer.render_frame())
+    self.clock.now = 0.1
+    self.assertTrue(self.renderer.render_frame())
+    self.assertEqual(self.stream.writes, ["first\n", "second\n"])
+
+  def test_idle_renderer_does_not_write(self):
+    self.assertFalse(self.renderer.render_frame())
+    self.clock.now = 10.0
+    self.assertFalse(self.renderer.render_frame())
+    self.assertEqual(self.stream.writes, [])
+
+  def test_burst_of_writes_only_wakes_render_thread_once(self):
+    condition = self.renderer._TerminalRenderer__condition
+    with mock.patch.object(condition, "notify", wraps=condition.notify) as notify:
+      for i in range(1000):
+        self.renderer.write(f"line {i}\n")
+      self.assertEqual(notify.call_count, 1)
+      self.renderer.render_frame()
+      for i in range(1000):
+        self.renderer.write(f"line {i}\n")
+      self.assertEqual(notify.call_count, 2)
+
+  def test_spinner_animates_at_its_own_interval(self):
+    self.renderer.start_spinner()
+    self.assertTrue(self.renderer.render_frame())
+    # Past the frame cap but not the spinner interval, so there's nothing worth drawing yet
+    self.clock.now = 0.1
+    self.assertFalse(self.renderer.render_frame())
+    self.clock.now = 0.2
+    self.assertTrue(self.renderer.render_frame())
+    # Spinning frames only backspace, the next glyph overwrites the old one
+    self.assertEqual(self.stream.writes, ["|", "\b/"])
+
+  def test_spinner_glyph_is_erased_after_stop(self):
+    self.renderer.start_spinner()
+    self.renderer.render_frame()
+    self.renderer.stop_spinner()
+    self.clock.now = 0.1
+    self.assertTrue(self.renderer.render_frame())
+    self.clock.now = 10.0
+    self.assertFalse(self.renderer.render_frame())
+    self.assertEqual(self.stream.writes, ["|", "\b \b"])
+
+  def test_every_spinner_glyph_is_coloured(self):
+    self.renderer.start_spinner(Fore.BLUE)
+    self.renderer.render_frame()
+    self.clock.now = 0.2
+    self.renderer.render_frame()
+    self.assertEqual(self.stream.writes, [f"{Fore.BLUE}|{Fore.RESET}", f"\b{Fore.BLUE}/{Fore.RESET}"])
+
+  def test_text_while_spinning_erases_glyph_first(self):
+    self.renderer.start_spinner()
+    self.renderer.render_frame()
+    self.renderer.write("text")
+    self.renderer.stop_spinner()
+    self.renderer.flush()
+    self.assertEqual(self.stream.writes, ["|", "\b \btext"])
+
+  def test_flush_draws_pending_text_immediately_and_in_order(self):
+    self.renderer.write("first\n")
+    self.renderer.flush()
+    # Still inside the frame cap, flush ignores it
+    self.renderer.write("second\n")
+    self.renderer.write("third\n")
+    self.renderer.flush()
+    self.assertEqual(self.stream.writes, ["first\n", "second\nthird\n"])
+
+  def test_close_stops_spinner_and_drains_pending(self):
+    self.renderer.start_spinner()
+    self.renderer.render_frame()
+    self.renderer.write("bye\n")
+    self.renderer.close()
+    self.assertEqual(self.stream.writes, ["|", "\b \bbye\n"])
+
+  def test_write_after_close_is_drawn_straight_away(self):
+    self.renderer.close()
+    self.renderer.start_spinner()
+    self.renderer.write("late\n")
+    self.assertEqual(self.stream.writes, ["late\n"])
+
+  def test_close_ends_the_render_thread(self):
+    before = threading.active_count()
+    renderer = TerminalRenderer(RecordingStream())
+    self.assertEqual(threading.active_count(), before + 1)
+    renderer.close()
+    self.assertEqual(threading.active_count(), before)
+
+if __name__ == "__main__":
+  unittest.main()